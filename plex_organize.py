@@ -37,23 +37,41 @@ This project was inspired by Plex Playlist Sorter by uswemar:
 https://github.com/uswemar/PlexPlaylistSorter
 """
 
+from __future__ import annotations
+
+import argparse
 import datetime
+import functools
+import itertools
+import json
+import operator
 import os
 import random
 import re
 import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import inquirer
 from plexapi import PlexConfig
-from plexapi.audio import Audio
-from plexapi.exceptions import Unauthorized
-from plexapi.library import MovieSection, MusicSection, PhotoSection, ShowSection
-from plexapi.myplex import MyPlexAccount, MyPlexResource
+from plexapi.base import USER_DONT_RELOAD_FOR_KEYS
+from plexapi.exceptions import BadRequest, NotFound, Unauthorized
+from plexapi.myplex import MyPlexAccount
 from plexapi.playlist import Playlist
 from plexapi.server import PlexServer
+from requests.adapters import HTTPAdapter
 from unidecode import unidecode
 
+if TYPE_CHECKING:
+    from plexapi.audio import Audio
+    from plexapi.base import PlexObject
+    from plexapi.library import MovieSection, MusicSection, PhotoSection, ShowSection
+    from plexapi.myplex import MyPlexResource
+
 __author__ = "Michael Pölzl"
 __copyright__ = "Copyright 2022-2025, Michael Pölzl"
 __credits__ = ""
@@ -64,6 +82,107 @@ __email__ = "michael.poelzl@proton.me"
 __status__ = "Production"
 
 
+ARTICLES = frozenset(
+    (
+        # German
+        "die",
+        "der",
+        "das",
+        "ein",
+        "eine",
+        # English
+        "the",
+        "a",
+        "an",
+        # Spanish
+        "el",
+        "la",
+        "los",
+        "las",
+        "un",
+        "una",
+        "unos",
+        "unas",
+        # French
+        "le",
+        "la",
+        "les",
+        "un",
+        "une",
+        "des",
+        # Italian
+        "il",
+        "lo",
+        "la",
+        "i",
+        "gli",
+        "un",
+        "una",
+        "uno",
+    ),
+)
+
+# Articles followed by a space, longest first, to detect a leading article with a single str.startswith() call
+ARTICLE_PREFIXES = tuple(f"{article} " for article in sorted(ARTICLES, key=lambda article: (-len(article), article)))
+
+# Sorting method returned by choose_sorting_method() when shuffling a playlist
+SHUFFLE_SORTING_METHOD = ("shuffle", "shuffle", "shuffle", "shuffle", False)
+
+# Number of items requested per batch when fetching whole library sections
+LIBRARY_CONTAINER_SIZE = 1000
+
+# Default number of requests sent to the Plex server concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Lowercases and transliterates ASCII, Latin, Greek and Cyrillic characters in a single str.translate() call
+SORTABLE_TRANSLATION_TABLE = {
+    **{codepoint: chr(codepoint).lower() for codepoint in range(ord("A"), ord("Z") + 1)},
+    **{codepoint: unidecode(chr(codepoint).lower()) for codepoint in range(0x80, 0x500)},
+}
+
+STRIP_CHARACTERS_PATTERN = re.compile(r"[*.:,;…'\"/\\!?$()=+#<>|‘“¡¿´`]")
+
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+# String conversions for choice types which aren't converted by reading an attribute
+OBJECT_TO_STRING_CONVERTERS = {
+    str: lambda item, attr: item,
+    dict: lambda item, attr: item.get(attr),
+}
+
+# Audio codecs which are considered lossless
+LOSSLESS_CODECS = frozenset(("alac", "flac"))
+
+# Minimum bitrates of lossy audio codecs, tracks with a lower bitrate must be upgraded
+MINIMUM_BITRATES = {
+    "mp3": 320,
+    "aac": 256,
+}
+
+# URLs of responses which must never be served from the HTTP cache
+PLAYLISTS_URL_PATTERN = re.compile(r"/playlists")
+LIBRARY_SECTIONS_URL_PATTERN = re.compile(r"/library/sections/?(?:\?|$)")
+
+# Attributes which are missing on tracks without a disc or track number, and must not make plexapi reload the track
+USER_DONT_RELOAD_FOR_KEYS.update(("index", "parentIndex"))
+
+# ANSI escape sequence which moves the cursor to the top left corner and clears the screen and its scrollback buffer
+CLEAR_SCREEN_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+# Answers to prompts which have been given on the command line or in an answers file, by the key of the prompt
+PROMPT_ANSWERS = {}
+
+# Indexes of music library sections which have already been loaded, by the key of their section
+LIBRARY_INDEXES = {}
+
+# Whether yes/no prompts without a given answer should be answered with their default choice instead of prompting
+USE_DEFAULT_ANSWERS = False
+
+# Whether the output is shown in an interactive shell. If it is redirected, e.g. to a file or another program, screen
+# clearing, progress bars and other messages are left out, so the output stays machine-readable.
+INTERACTIVE_OUTPUT = sys.stdout.isatty()
+
+
 def clear():
     """
     Function: clear()
@@ -71,10 +190,15 @@ def clear():
     Clears the shell depending on the operating system.
     """
 
-    try:
-        os.system("clear")
-    except Exception:
+    if not INTERACTIVE_OUTPUT:
+        return
+
+    if os.name == "nt":
         os.system("cls")
+    else:
+        # Write the escape sequence directly instead of spawning a "clear" process every time
+        sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+        sys.stdout.flush()
 
 
 def duration_to_str(duration: int) -> str:
@@ -126,7 +250,7 @@ def print_progress_bar(
     """
     Function: print_progress_bar()
 
-    Prints a terminal progress bar on a single updating line.
+    Prints a terminal progress bar on a single updating line. Nothing is printed if the output is redirected.
 
     :param current: Current number of processed items
     :type current: int
@@ -140,6 +264,10 @@ def print_progress_bar(
     :type width: int
     """
 
+    # A progress bar updating a single line is only readable in an interactive shell
+    if not INTERACTIVE_OUTPUT:
+        return
+
     progress = current / total if total else 1
     filled_width = int(width * progress)
     bar = "#" * filled_width + "-" * (width - filled_width)
@@ -179,7 +307,7 @@ def audio_to_str(item: Audio) -> str:
     """
 
     return (
-        f"{artist(item)} - {item.title} ({item.album().title}) "
+        f"{artist(item)} - {item.title} ({item.parentTitle}) "
         f"[{duration_to_str(item.media[0].duration)}][{item.media[0].audioCodec}][{item.media[0].bitrate}]"
     )
 
@@ -282,11 +410,39 @@ def object_to_string(item: any, attr: str) -> str:
     :rtype: bool
     """
 
-    return (
-        attr(item)
-        if callable(attr)
-        else (item if isinstance(item, str) else (item.get(attr) if isinstance(item, dict) else getattr(item, attr)))
-    )
+    if callable(attr):
+        return attr(item)
+
+    return OBJECT_TO_STRING_CONVERTERS.get(type(item), getattr)(item, attr)
+
+
+@functools.lru_cache(maxsize=8192)
+def sortable_text(term: str) -> str:
+    """
+    Function: sortable_text()
+
+    Normalizes a text value for sorting by removing articles and special characters. Results are cached because the
+    same titles and artists are normalized over and over again while sorting and upgrading playlists.
+
+    :param term: Text to normalize
+    :type term: str
+    :returns: Normalized text to be used for sorting
+    :rtype: str
+    """
+
+    translated_term = term.translate(SORTABLE_TRANSLATION_TABLE)
+
+    # Fall back to unidecode for the whole term if it contains characters which are not covered by the translation
+    # table, as transliterations of covered characters would otherwise be lowercased once more
+    term = translated_term if translated_term.isascii() else unidecode(term.lower())
+
+    if term.startswith(ARTICLE_PREFIXES):
+        term = term.partition(" ")[2]
+
+    term = term.replace("&", "and")
+    term = STRIP_CHARACTERS_PATTERN.sub("", term)
+
+    return term.strip()
 
 
 def sortable_term(term: str | int | float | datetime.date | None) -> tuple[int, str | int | float]:
@@ -310,59 +466,10 @@ def sortable_term(term: str | int | float | datetime.date | None) -> tuple[int,
     if isinstance(term, datetime.date):
         return (2, term.isoformat())
 
-    term = unidecode(str(term).lower())
-
-    articles = [
-        # German
-        "die",
-        "der",
-        "das",
-        "ein",
-        "eine",
-        # English
-        "the",
-        "a",
-        "an",
-        # Spanish
-        "el",
-        "la",
-        "los",
-        "las",
-        "un",
-        "una",
-        "unos",
-        "unas",
-        # French
-        "le",
-        "la",
-        "les",
-        "un",
-        "une",
-        "des",
-        # Italian
-        "il",
-        "lo",
-        "la",
-        "i",
-        "gli",
-        "un",
-        "una",
-        "uno",
-    ]
-
-    words = term.split(" ")
-
-    if len(words) > 1 and words[0] in articles:
-        words.pop(0)
-        term = " ".join(words)
-
-    term = term.replace("&", "and")
-    term = re.sub(r"[*.:,;…'\"/\\!?$()=+#<>|‘“¡¿´`]", "", term)
-
-    return (3, term.strip())
+    return (3, sortable_text(str(term)))
 
 
-def check_quality_requirements(item: Audio) -> bool:
+def check_quality_requirements(item: Audio, force_all: bool = False, force_lossless: bool = False) -> bool:
     """
     Function: check_quality_requirements()
 
@@ -370,41 +477,117 @@ def check_quality_requirements(item: Audio) -> bool:
 
     :param item: Audio object representing the track to check
     :type item: Audio
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
     :returns: A boolean
     :rtype: bool
     """
 
-    if bool(config.get("upgrade.force_all")):
+    if force_all:
         return False
 
-    if bool(config.get("upgrade.force_lossless")):
-        return item.media[0].audioCodec in [
-            "alac",
-            "flac",
-        ]
+    media = item.media[0]
 
-    return not (
-        item.media[0].audioCodec == "mp3"
-        and item.media[0].bitrate < 320
-        or item.media[0].audioCodec == "aac"
-        and item.media[0].bitrate < 256
-    )
+    if force_lossless:
+        return media.audioCodec in LOSSLESS_CODECS
+
+    minimum_bitrate = MINIMUM_BITRATES.get(media.audioCodec)
+
+    return minimum_bitrate is None or media.bitrate >= minimum_bitrate
+
+
+def get_low_quality_track_filters(force_all: bool = False, force_lossless: bool = False) -> dict | None:
+    """
+    Function: get_low_quality_track_filters()
+
+    Returns advanced filters for a library search which let the Plex server exclude tracks that certainly meet the
+    quality requirements as defined in check_quality_requirements(). The filtered tracks still have to be checked with
+    check_quality_requirements(), as the filters only narrow down the tracks by bitrate.
+
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
+    :returns: A dict of advanced filters, or None if all tracks have to be checked
+    :rtype: dict|None
+    """
+
+    if force_all or force_lossless:
+        return None
+
+    return {"track.bitrate<<": max(MINIMUM_BITRATES.values())}
+
+
+def search_filters_accepted(section: MusicSection, libtype: str, filters: dict) -> bool:
+    """
+    Function: search_filters_accepted()
+
+    Checks whether advanced filters are supported for a library search, both by plexapi and by the Plex server, by
+    searching for a single item. Errors of the actual search are not caught, so they aren't mistaken for rejected
+    filters.
+
+    :param section: Library section object
+    :type section: MusicSection
+    :param libtype: Type of the items to search for, e.g. "track" or "album"
+    :type libtype: str
+    :param filters: Advanced filters to be checked, see LibrarySection.search()
+    :type filters: dict
+    :returns: True if the filters are accepted, False otherwise
+    :rtype: bool
+    """
+
+    try:
+        section.search(libtype=libtype, maxresults=1, filters=filters, includeGuids=False)
+    except (BadRequest, NotFound):
+        return False
+
+    return True
 
 
-def confirm_question(message: str, default: bool = True) -> bool:
+def replacement_sort_key(item: Audio) -> tuple[int, str]:
+    """
+    Function: replacement_sort_key()
+
+    Returns the key to sort potential replacement tracks by, ordering them by bitrate (highest first) and artist.
+
+    :param item: Audio object representing a potential replacement track
+    :type item: Audio
+    :returns: Key to be used for sorting
+    :rtype: tuple[int, str]
+    """
+
+    return -item.media[0].bitrate, item.originalTitle if item.originalTitle is not None else item.grandparentTitle
+
+
+def confirm_question(message: str, default: bool = True, key: str | None = None) -> bool:
     """
     Function: confirm_question()
 
-    Prompts a simple question with 'Yes' and 'No' choices.
+    Prompts a simple question with 'Yes' and 'No' choices. If an answer for the question has been given on the command
+    line or in an answers file, it is returned without prompting.
 
     :param message: The question to prompt
     :type message: str
     :param default: Whether 'Yes' or 'No' should be set as the default choice
     :type default: bool
+    :param key: The key of the question in the given answers
+    :type key: str|None
     :returns: A boolean
     :rtype: bool
     """
 
+    if key in PROMPT_ANSWERS:
+        answer = PROMPT_ANSWERS[key]
+        if not isinstance(answer, bool):
+            print(f'ERROR: "{answer}" is not a valid answer to "{message}", it must be true or false.')
+            sys.exit(1)
+        return answer
+
+    if key is not None and USE_DEFAULT_ANSWERS:
+        return default
+
     questions = [
         inquirer.Confirm(
             "confirm",
@@ -424,11 +607,13 @@ def question(
     attr: str | None = None,
     none_choice: bool = False,
     automatic_single_coice_return: bool = False,
+    key: str | None = None,
 ) -> any:
     """
     Function: question()
 
-    Prompts a question with choices.
+    Prompts a question with choices. If an answer for the question has been given on the command line or in an answers
+    file, the matching item is returned without prompting.
 
     :param message: The question to prompt
     :type message: str
@@ -441,6 +626,8 @@ def question(
     :returns: Whether the answers should include a "None" option by default
     :type automatic_single_coice_return: bool
     :returns: Whether the function should automatically return the only available option by default
+    :type key: str|None
+    :returns: The key of the question in the given answers
     :rtype: any
     """
 
@@ -448,34 +635,44 @@ def question(
     if len(items) == 1 and automatic_single_coice_return:
         return items[0]
 
-    clear()
-
     choices = []
 
     if none_choice:
         choices.insert(0, "None")
 
+    # Map the string representations to their items, keeping the first item if several items share the same one
+    items_by_choice = {}
     if items is not None:
         for item in items:
-            choices.append(object_to_string(item, attr))
+            choice = object_to_string(item, attr)
+            choices.append(choice)
+            items_by_choice.setdefault(choice, item)
 
     choices.append("❌ Abort")
 
-    questions = [
-        inquirer.List(
-            "question",
-            message=message or "What do you want to do?",
-            choices=choices,
-        ),
-    ]
+    if key in PROMPT_ANSWERS:
+        answer = PROMPT_ANSWERS[key]
+        if answer not in choices:
+            print(f'ERROR: "{answer}" is not a valid answer to "{message}".')
+            sys.exit(1)
+    else:
+        clear()
 
-    answers = inquirer.prompt(questions)
-    answer = answers["question"]
+        questions = [
+            inquirer.List(
+                "question",
+                message=message or "What do you want to do?",
+                choices=choices,
+            ),
+        ]
+
+        answers = inquirer.prompt(questions)
+        answer = answers["question"]
 
     if answer == "❌ Abort":
         sys.exit()
 
-    return next((item for item in items if object_to_string(item, attr) == answers["question"]), None)
+    return items_by_choice.get(answer)
 
 
 def choose_sorting_method(playlist: Playlist) -> tuple:
@@ -565,10 +762,11 @@ def choose_sorting_method(playlist: Playlist) -> tuple:
         items=choices,
         attr="name",
         automatic_single_coice_return=False,
+        key="sort_key",
     )
 
     if selected_choice["key"] == "shuffle":
-        return selected_choice["key"], selected_choice["key"], selected_choice["key"], selected_choice["key"], False
+        return SHUFFLE_SORTING_METHOD
 
     sorting_choices = [
         {
@@ -588,6 +786,7 @@ def choose_sorting_method(playlist: Playlist) -> tuple:
         items=sorting_choices,
         attr="name",
         automatic_single_coice_return=False,
+        key="sort_direction",
     )
 
     return (
@@ -599,6 +798,53 @@ def choose_sorting_method(playlist: Playlist) -> tuple:
     )
 
 
+def configure_session(config: PlexConfig, server: PlexServer) -> PlexServer:
+    """
+    Function: configure_session()
+
+    Configures the HTTP session of a connected Plex server, so it keeps enough connections open for all concurrent
+    requests instead of opening and discarding additional connections. If enabled, responses of the Plex server are
+    cached on disk, so repeated requests, e.g. of the same library, don't need to be answered by the server again.
+
+    :param config: PlexConfig object
+    :type config: PlexConfig
+    :param server: PlexServer object
+    :type server: PlexServer
+    :returns: The configured PlexServer object
+    :rtype: PlexServer
+    """
+
+    cache_expire_after = get_cache_expire_after(config)
+    if cache_expire_after is not None:
+        import requests_cache
+
+        # Playlists are modified by this script and the list of library sections tells when a library has been
+        # updated, so responses for them must never be served from the cache. Library items are requested in batches
+        # which only differ in their paging headers, so these headers must be part of the cache key.
+        server._session = requests_cache.CachedSession(
+            get_cache_directory() / "http_cache",
+            backend="sqlite",
+            expire_after=cache_expire_after,
+            urls_expire_after={
+                PLAYLISTS_URL_PATTERN: requests_cache.DO_NOT_CACHE,
+                LIBRARY_SECTIONS_URL_PATTERN: requests_cache.DO_NOT_CACHE,
+            },
+            allowable_methods=("GET",),
+            cache_control=True,
+            ignored_parameters=("X-Plex-Token",),
+            match_headers=("X-Plex-Container-Start", "X-Plex-Container-Size"),
+        )
+
+    # Concurrent requests wait for a free connection of the pool instead of opening additional connections, so all
+    # requests are sent over a fixed number of kept-alive connections
+    max_workers = get_max_workers(config)
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, pool_block=True)
+    server._session.mount("http://", adapter)
+    server._session.mount("https://", adapter)
+
+    return server
+
+
 def get_account(config: PlexConfig) -> MyPlexAccount:
     """
     Function: get_account()
@@ -634,7 +880,7 @@ def get_account(config: PlexConfig) -> MyPlexAccount:
             print(account.authenticationToken)
             print()
 
-            if not confirm_question("Do you want to do proceed?"):
+            if not confirm_question("Do you want to do proceed?", key="proceed"):
                 sys.exit()
 
             return account
@@ -684,7 +930,7 @@ def get_account(config: PlexConfig) -> MyPlexAccount:
             print(account.authenticationToken)
             print()
 
-            if not confirm_question("Do you want to do proceed?"):
+            if not confirm_question("Do you want to do proceed?", key="proceed"):
                 sys.exit()
 
             return account
@@ -699,6 +945,97 @@ def get_account(config: PlexConfig) -> MyPlexAccount:
             print()
 
 
+def get_arguments() -> argparse.Namespace:
+    """
+    Function: get_arguments()
+
+    Parses the command line arguments which allow running the script without or with fewer prompts.
+
+    :returns: A Namespace object with the parsed arguments
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Organize the playlists of your Plex Media Server.")
+    parser.add_argument(
+        "--answers",
+        type=Path,
+        help="JSON file with answers to the prompts by their key, the script exits after performing a single action",
+    )
+    parser.add_argument(
+        "--use-defaults",
+        action="store_true",
+        help="answer all yes/no prompts which have not been answered otherwise with their default choice, the script "
+        "exits after performing a single action",
+    )
+    parser.add_argument(
+        "--since",
+        type=since_argument,
+        help='only search music albums with low bitrate which have been added after a date (YYYY-MM-DD) or "last" scan',
+    )
+    parser.add_argument("--dry-run", action="store_true", help="perform a dry run when upgrading a playlist")
+    parser.add_argument(
+        "--simple", action="store_true", help="use the simple replacement mode when upgrading a playlist"
+    )
+
+    return parser.parse_args()
+
+
+def since_argument(value: str) -> str | datetime.datetime:
+    """
+    Function: since_argument()
+
+    Validates the value of the --since command line argument.
+
+    :param value: "last" or a date in ISO format
+    :type value: str
+    :returns: "last" or the parsed datetime
+    :rtype: str|datetime.datetime
+    """
+
+    if value == "last":
+        return value
+
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'"{value}" is neither "last" nor a date in YYYY-MM-DD format') from None
+
+
+def get_prompt_answers(arguments: argparse.Namespace) -> dict:
+    """
+    Function: get_prompt_answers()
+
+    Collects the answers to prompts from the answers file and the command line arguments.
+
+    :param arguments: Namespace object with the parsed command line arguments
+    :type arguments: argparse.Namespace
+    :returns: A dict with the answers by the key of their prompt
+    :rtype: dict
+    """
+
+    answers = {}
+
+    if arguments.answers is not None:
+        try:
+            answers.update(json.loads(arguments.answers.read_text(encoding="utf-8")))
+        except (OSError, ValueError) as e:
+            print(f'ERROR: Could not read answers from "{arguments.answers}".')
+            print(e)
+            sys.exit(1)
+
+    if arguments.dry_run:
+        answers["dry_run"] = True
+
+    if arguments.simple:
+        answers["simple_mode"] = True
+
+    # Unattended runs only perform a single action
+    if arguments.answers is not None or arguments.use_defaults:
+        answers["organize_another"] = False
+
+    return answers
+
+
 def get_config() -> PlexConfig:
     """
     Function: get_config()
@@ -758,12 +1095,104 @@ def get_server(config: PlexConfig) -> PlexServer:
         items=resources,
         attr="name",
         automatic_single_coice_return=True,
+        key="resource",
     )
 
     # Connect to the selected resource and create a server object
     return account.resource(resource.name).connect()
 
 
+def get_cache_directory() -> Path:
+    """
+    Function: get_cache_directory()
+
+    Returns the directory in which cached data of this script is stored.
+
+    :returns: Path to the cache directory
+    :rtype: Path
+    """
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "plex_organize"
+
+
+def read_cache_file(file_name: str) -> dict:
+    """
+    Function: read_cache_file()
+
+    Reads a JSON file from the cache directory.
+
+    :param file_name: Name of the file in the cache directory
+    :type file_name: str
+    :returns: The content of the file, or an empty dict if the file doesn't exist or can't be read
+    :rtype: dict
+    """
+
+    try:
+        return json.loads((get_cache_directory() / file_name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_cache_file(file_name: str, data: dict) -> None:
+    """
+    Function: write_cache_file()
+
+    Writes a JSON file to the cache directory. The data is written to a temporary file first, so an interrupted write
+    never leaves a broken file behind.
+
+    :param file_name: Name of the file in the cache directory
+    :type file_name: str
+    :param data: The content of the file
+    :type data: dict
+    """
+
+    cache_file = get_cache_directory() / file_name
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file = cache_file.with_suffix(".tmp")
+        temporary_file.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temporary_file, cache_file)
+    except OSError as e:
+        # Warnings must not be mixed into the output, as it may be processed by another program
+        print(f'WARNING: Could not write to "{cache_file}".', file=sys.stderr)
+        print(e, file=sys.stderr)
+
+
+def get_cache_expire_after(config: PlexConfig) -> int | None:
+    """
+    Function: get_cache_expire_after()
+
+    Returns the number of seconds after which cached responses of the Plex server expire.
+
+    :param config: PlexConfig object
+    :type config: PlexConfig
+    :returns: Number of seconds, or None if responses should not be cached
+    :rtype: int|None
+    """
+
+    expire_after = (config.get("cache.expire_after") or "").strip()
+
+    return int(expire_after) if expire_after.isdigit() and int(expire_after) > 0 else None
+
+
+def get_max_workers(config: PlexConfig) -> int:
+    """
+    Function: get_max_workers()
+
+    Returns the maximum number of requests which may be sent to the Plex server concurrently.
+
+    :param config: PlexConfig object
+    :type config: PlexConfig
+    :returns: Maximum number of concurrent requests
+    :rtype: int
+    """
+
+    max_workers = (config.get("performance.max_workers") or "").strip()
+
+    return max(1, int(max_workers)) if max_workers.isdigit() else DEFAULT_MAX_WORKERS
+
+
 def get_playlists(server: PlexServer, filter_type: list = None) -> list[Playlist]:
     """
     Function: get_playlists()
@@ -776,25 +1205,29 @@ def get_playlists(server: PlexServer, filter_type: list = None) -> list[Playlist
     :rtype: list[Playlist]
     """
 
-    if not filter_type:
-        filter_type = ["audio", "video"]
+    filter_types = frozenset(filter_type or ("audio", "video"))
 
-    return [playlist for playlist in server.playlists() if not playlist.smart and playlist.playlistType in filter_type]
+    return [playlist for playlist in server.playlists() if not playlist.smart and playlist.playlistType in filter_types]
 
 
 def get_sections(
     server: PlexServer,
     section_type: str,
+    refresh: bool = False,
 ) -> list[MovieSection | ShowSection | MusicSection | PhotoSection]:
     """
     Function: get_sections()
 
-    Returns all library sections from a connected resource.
+    Returns all library sections from a connected resource. The library sections are only loaded once and then kept
+    by the PlexServer object, so they have to be refreshed if their current state is needed, e.g. when they were last
+    updated.
 
     :param server: PlexServer object
     :type server: PlexServer
     :param section_type: Section type
     :type section_type: str
+    :param refresh: Whether the returned library sections should be loaded again
+    :type refresh: bool
     :returns: A list of library section objects
     :rtype: list[MovieSection|ShowSection|MusicSection|PhotoSection]
     """
@@ -804,9 +1237,183 @@ def get_sections(
     if section_type:
         sections = [section for section in sections if section.type == section_type]
 
+    # Reload the section objects themselves, as reloading the whole library isn't permitted for shared servers
+    if refresh:
+        for section in sections:
+            section.reload()
+
     return sections
 
 
+def iter_section_items(
+    section: MusicSection,
+    libtype: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    filters: dict | None = None,
+) -> Iterator[PlexObject]:
+    """
+    Function: iter_section_items()
+
+    Yields all items of a specific type from a library section. The items are fetched in large batches, with several
+    batches being requested concurrently. Items are yielded as soon as their batch has been loaded, so they can be
+    processed while the following batches are still being loaded, and only a few batches are kept in memory at once.
+
+    :param section: Library section object
+    :type section: MusicSection
+    :param libtype: Type of the items to return, e.g. "track" or "album"
+    :type libtype: str
+    :param max_workers: Maximum number of concurrent requests
+    :type max_workers: int
+    :param filters: Advanced filters to be applied by the Plex server, see LibrarySection.search()
+    :type filters: dict|None
+    :returns: A generator of library items
+    :rtype: Iterator[PlexObject]
+    """
+
+    def get_batch(container_start: int) -> list[PlexObject]:
+        return section.search(
+            libtype=libtype,
+            container_start=container_start,
+            container_size=LIBRARY_CONTAINER_SIZE,
+            maxresults=LIBRARY_CONTAINER_SIZE,
+            filters=filters,
+            # The external IDs of the items are never used, so the Plex server doesn't need to add them
+            includeGuids=False,
+        )
+
+    # The number of filtered items isn't known in advance, so batches are requested until an incomplete one is returned
+    container_starts = itertools.count(0, LIBRARY_CONTAINER_SIZE)
+
+    # Most filtered searches and small sections fit into a single batch, so further batches are only requested
+    # concurrently once the first one turns out to be complete
+    batch = get_batch(next(container_starts))
+    if len(batch) < LIBRARY_CONTAINER_SIZE:
+        yield from batch
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending_batches = deque(
+            executor.submit(get_batch, container_start)
+            for container_start in itertools.islice(container_starts, max_workers)
+        )
+        yield from batch
+
+        while pending_batches:
+            batch = pending_batches.popleft().result()
+
+            if len(batch) < LIBRARY_CONTAINER_SIZE:
+                # This was the last batch, so the remaining requests can be cancelled
+                for pending_batch in pending_batches:
+                    pending_batch.cancel()
+                pending_batches.clear()
+            else:
+                # Request the next batch before processing the current one
+                pending_batches.append(executor.submit(get_batch, next(container_starts)))
+
+            yield from batch
+
+
+@dataclass
+class PlexLibraryIndex:
+    """
+    Class: PlexLibraryIndex
+
+    In-memory index of all tracks of a music library section, which allows looking up tracks by their title without
+    sending any further requests to the Plex server.
+    """
+
+    section_key: int
+    updated_at: datetime.datetime | None
+    tracks_by_title: dict[tuple, list[Audio]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        section: MusicSection,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        filters: dict | None = None,
+    ) -> PlexLibraryIndex:
+        """
+        Function: PlexLibraryIndex.build()
+
+        Fetches all tracks of a music library section and indexes them by their sortable title.
+
+        :param section: MusicSection object
+        :type section: MusicSection
+        :param max_workers: Maximum number of concurrent requests
+        :type max_workers: int
+        :param filters: Advanced filters to be applied by the Plex server to only index matching tracks
+        :type filters: dict|None
+        :returns: A PlexLibraryIndex object
+        :rtype: PlexLibraryIndex
+        """
+
+        index = cls(section_key=section.key, updated_at=section.updatedAt)
+
+        for track in iter_section_items(section, "track", max_workers, filters):
+            index.tracks_by_title.setdefault(sortable_term(track.title), []).append(track)
+
+        return index
+
+    def find_tracks(self, title: str) -> list[Audio]:
+        """
+        Function: PlexLibraryIndex.find_tracks()
+
+        Returns all tracks with the same sortable title as the provided title.
+
+        :param title: Title of the tracks to find
+        :type title: str
+        :returns: A list of Audio objects
+        :rtype: list[Audio]
+        """
+
+        return self.tracks_by_title.get(sortable_term(title), [])
+
+
+def get_library_index(section: MusicSection, max_workers: int = DEFAULT_MAX_WORKERS) -> PlexLibraryIndex:
+    """
+    Function: get_library_index()
+
+    Returns the index of a music library section. An index which has already been loaded is reused as long as the
+    library section hasn't been updated since, so organizing another playlist doesn't load the whole library again.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param max_workers: Maximum number of concurrent requests
+    :type max_workers: int
+    :returns: A PlexLibraryIndex object
+    :rtype: PlexLibraryIndex
+    """
+
+    library_index = LIBRARY_INDEXES.get(section.key)
+
+    if library_index is None or library_index.updated_at is None or library_index.updated_at != section.updatedAt:
+        library_index = LIBRARY_INDEXES[section.key] = PlexLibraryIndex.build(section, max_workers)
+
+    return library_index
+
+
+def search_library_tracks(server: PlexServer, item: Audio) -> list[Audio]:
+    """
+    Function: search_library_tracks()
+
+    Searches all libraries of a connected resource for tracks with the same title and artist as the provided track.
+
+    :param server: PlexServer object
+    :type server: PlexServer
+    :param item: Audio object representing the track to search for
+    :type item: Audio
+    :returns: A list of Audio objects
+    :rtype: list[Audio]
+    """
+
+    return server.library.search(
+        title=PUNCTUATION_PATTERN.sub("", item.title),
+        artist=PUNCTUATION_PATTERN.sub("", artist(item)),
+        libtype="track",
+    )
+
+
 def get_resources(account: MyPlexAccount) -> list[MyPlexResource]:
     """
     Function: get_resources()
@@ -863,6 +1470,74 @@ def move_playlist_items_one_by_one(playlist: Playlist, items: list) -> Playlist:
     return playlist
 
 
+def recreate_playlist(server: PlexServer, playlist: Playlist, items: list) -> Playlist:
+    """
+    Function: recreate_playlist()
+
+    Sorts a playlist by creating a new playlist with the same title and summary containing the items in the desired
+    order and deleting the original playlist afterwards. This only takes two requests no matter how many items the
+    playlist contains.
+
+    :param server: PlexServer object
+    :type server: PlexServer
+    :param playlist: Playlist object
+    :type playlist: Playlist
+    :param items: Playlist items in the desired order
+    :type items: list
+    :returns: The newly created Playlist object
+    :rtype: Playlist
+    """
+
+    # The new playlist gets a new ID, so anything tied to the original playlist (e.g. a custom poster or play
+    # history) is lost. The original playlist is only deleted after the new one has been created successfully.
+    new_playlist = Playlist.create(
+        server=server,
+        title=playlist.title,
+        summary=playlist.summary,
+        items=items,
+        playlistType=playlist.playlistType,
+    )
+    playlist.delete()
+
+    return new_playlist
+
+
+def sort_playlist_items(items: list, sort_keys: list[tuple[str, str]], sort_reverse: bool = False) -> list:
+    """
+    Function: sort_playlist_items()
+
+    Sorts playlist items by one or more object keys in a single pass. The sortable terms are computed once per item and
+    sorted together with the items, so the attribute lookups and term normalization don't have to be repeated during
+    sorting.
+
+    :param items: Playlist items to sort
+    :type items: list
+    :param sort_keys: Pairs of object keys and backup object keys to sort the items by, in order of precedence.
+                      The backup object key is used if the object key is of type NoneType.
+    :type sort_keys: list[tuple[str, str]]
+    :param sort_reverse: Whether the items should be sorted in reverse order
+    :type sort_reverse: bool
+    :returns: A new list with the sorted items
+    :rtype: list
+    """
+
+    getters = [
+        (operator.attrgetter(sort_key), operator.attrgetter(backup_sort_key)) for sort_key, backup_sort_key in sort_keys
+    ]
+
+    decorated_items = []
+    for item in items:
+        terms = []
+        for get_value, get_backup_value in getters:
+            value = get_value(item)
+            terms.append(sortable_term(value if value is not None else get_backup_value(item)))
+        decorated_items.append((tuple(terms), item))
+
+    decorated_items.sort(key=operator.itemgetter(0), reverse=sort_reverse)
+
+    return [item for _, item in decorated_items]
+
+
 def sort_playlist(
     server: PlexServer,
     playlist: Playlist,
@@ -872,6 +1547,7 @@ def sort_playlist(
     backup_secondary_sort_key: str = "title",
     sort_reverse: bool = False,
     duplicate: bool = False,
+    recreate: bool = False,
 ) -> Playlist:
     """
     Function: sort_playlist()
@@ -898,6 +1574,9 @@ def sort_playlist(
     :type sort_reverse: bool
     :param duplicate: Whether you want to create a duplicated playlist instead of modifying the selected one
     :type duplicate: bool
+    :param recreate: Whether you want to replace the selected playlist with a newly created and sorted one instead of
+                     moving every single item
+    :type recreate: bool
     :returns: A Playlist object, either the modified or a newly created one
     :rtype: Playlist
     """
@@ -916,26 +1595,11 @@ def sort_playlist(
     if sort_key == "shuffle":
         random.shuffle(items)
     else:
+        sort_keys = [(sort_key, backup_sort_key)]
         if secondary_sort_key and playlist.playlistType == "audio":
-            items = sorted(
-                items,
-                key=lambda x: (
-                    sortable_term(getattr(x, secondary_sort_key))
-                    if getattr(x, secondary_sort_key) is not None
-                    else sortable_term(getattr(x, backup_secondary_sort_key))
-                ),
-                reverse=sort_reverse,
-            )
+            sort_keys.append((secondary_sort_key, backup_secondary_sort_key))
 
-        items = sorted(
-            items,
-            key=lambda x: (
-                sortable_term(getattr(x, sort_key))
-                if getattr(x, sort_key) is not None
-                else sortable_term(getattr(x, backup_sort_key))
-            ),
-            reverse=sort_reverse,
-        )
+        items = sort_playlist_items(items, sort_keys, sort_reverse)
 
     # Create a new playlist with sorted items
     if duplicate:
@@ -958,7 +1622,10 @@ def sort_playlist(
         print(f'Playlist "{playlist.title}" is already sorted.')
         return playlist
 
-    move_playlist_items_one_by_one(playlist, items)
+    if recreate:
+        playlist = recreate_playlist(server, playlist, items)
+    else:
+        move_playlist_items_one_by_one(playlist, items)
 
     print(f'Successfully sorted playlist "{playlist.title}".')
     return playlist
@@ -1019,25 +1686,49 @@ def upgrade_playlist(
 
         print(f'Successfully created playlist "{new_playlist.title}".')
         playlist = new_playlist
-        items = playlist.items()
 
     items_to_remove = []
     items_to_add = []
     items_ommited = []
 
+    # Find potential replacement tracks in your library for all tracks which fail to meet the quality requirements
+    force_all = bool(config.get("upgrade.force_all"))
+    force_lossless = bool(config.get("upgrade.force_lossless"))
+    items_to_upgrade = [item for item in items if not check_quality_requirements(item, force_all, force_lossless)]
+    search_results_by_item = {}
+    if items_to_upgrade:
+        if bool(config.get("upgrade.preload_library")):
+            # Load all library tracks at once instead of searching the library for every single track. Only tracks with
+            # the same sortable title are found this way, while the library search also finds partial matches.
+            print("Loading music library tracks...")
+            library_indexes = [
+                get_library_index(section, get_max_workers(config))
+                for section in get_sections(server, "artist", refresh=True)
+            ]
+            search_results_by_item = {
+                playlist_item_order_key(item): [
+                    track for library_index in library_indexes for track in library_index.find_tracks(item.title)
+                ]
+                for item in items_to_upgrade
+            }
+        else:
+            # Search the library for every single track, running several searches concurrently
+            print("Searching music library tracks...")
+            with ThreadPoolExecutor(max_workers=get_max_workers(config)) as executor:
+                search_results = executor.map(functools.partial(search_library_tracks, server), items_to_upgrade)
+                search_results_by_item = {
+                    playlist_item_order_key(item): results
+                    for item, results in zip(items_to_upgrade, search_results, strict=True)
+                }
+
     clear()
 
     # Analyze all tracks in the playlist and check if they fail to meet the quality requirements
     for item in items:
-        if not check_quality_requirements(item):
+        if not check_quality_requirements(item, force_all, force_lossless):
             print(f"❌ {audio_to_str(item)} must be upgraded.")
 
-            # Search for the same track in your library
-            search_results = server.library.search(
-                title=re.sub(r"[^\w\s]", "", item.title),
-                artist=re.sub(r"[^\w\s]", "", artist(item)),
-                libtype="track",
-            )
+            search_results = search_results_by_item[playlist_item_order_key(item)]
 
             # Remove all tracks with lower quality
             replacements = [
@@ -1047,13 +1738,6 @@ def upgrade_playlist(
             # Remove all tracks where there's a completely different artist
             replacements = [r for r in replacements if artist(item).casefold() in artist(r).casefold()]
 
-            # Sort the search results by bitrate and artist
-            replacements = sorted(
-                replacements,
-                key=lambda x: x.originalTitle if x.originalTitle is not None else x.grandparentTitle,
-            )
-            replacements = sorted(replacements, key=lambda x: x.media[0].bitrate, reverse=True)
-
             if not len(replacements):
                 items_ommited.append(item)
                 print("❔ No potential replacement tracks found. No changes to the track will be made.")
@@ -1064,7 +1748,7 @@ def upgrade_playlist(
             # Simple replacement mode
             if simple_mode:
                 # Automatically select the track with the highest bitrate as the replacement track
-                replacement = replacements[0]
+                replacement = min(replacements, key=replacement_sort_key)
                 print(f"🆕 {audio_to_str(replacement)} will be used instead.")
 
                 # Add the tracks to separate lists for future usage
@@ -1076,10 +1760,10 @@ def upgrade_playlist(
 
             # Manual replacement mode
             else:
-                # List all tracks with higher bitrates
+                # List all tracks with higher bitrates, sorted by bitrate and artist
                 replacement = question(
                     message=f'Select a replacement track for "{audio_to_str(item)}"',
-                    items=replacements,
+                    items=sorted(replacements, key=replacement_sort_key),
                     attr=audio_to_str,
                     none_choice=True,
                     automatic_single_coice_return=False,
@@ -1138,6 +1822,378 @@ def upgrade_playlist(
     return playlist
 
 
+def track_order_key(item: Audio) -> tuple[int, int]:
+    """
+    Function: track_order_key()
+
+    Returns a key to sort tracks in their order on an album.
+
+    :param item: Audio object representing a track
+    :type item: Audio
+    :returns: A tuple of the disc and track number
+    :rtype: tuple[int, int]
+    """
+
+    return item.parentIndex or 0, item.index or 0
+
+
+def get_low_quality_tracks_by_album(
+    section: MusicSection,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    force_all: bool = False,
+    force_lossless: bool = False,
+    filters: dict | None = None,
+    total: int | None = None,
+) -> dict[int, tuple[tuple[int, int], str, int]]:
+    """
+    Function: get_low_quality_tracks_by_album()
+
+    Checks all tracks of a music library section in a single pass and returns the order key, audio codec and bitrate of
+    the first track of every album which fails to meet the quality requirements as defined in
+    check_quality_requirements().
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param max_workers: Maximum number of concurrent requests
+    :type max_workers: int
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
+    :param filters: Advanced filters to be applied by the Plex server to only check matching tracks
+    :type filters: dict|None
+    :param total: Total number of tracks to check, used to print the progress if given
+    :type total: int|None
+    :returns: A dict of tuples with the order key, audio codec and bitrate of a track by the rating key of its album
+    :rtype: dict[int, tuple[tuple[int, int], str, int]]
+    """
+
+    low_quality_tracks = {}
+
+    progress_started_at = datetime.datetime.now()
+    if total is not None:
+        print_progress_bar(0, total, "Checking tracks", progress_started_at)
+
+    for index, track in enumerate(iter_section_items(section, "track", max_workers, filters), start=1):
+        # Tracks are loaded in batches, so the progress only has to be updated once per batch
+        if total is not None and index % LIBRARY_CONTAINER_SIZE == 0:
+            print_progress_bar(index, total, "Checking tracks", progress_started_at)
+
+        if check_quality_requirements(track, force_all, force_lossless):
+            continue
+
+        # Keep the first track of the album which fails to meet the quality requirements. Only the attributes which
+        # are needed later on are kept, so the track objects and their parsed XML data can be freed right away.
+        order_key = track_order_key(track)
+        low_quality_track = low_quality_tracks.get(track.parentRatingKey)
+        if low_quality_track is None or order_key < low_quality_track[0]:
+            low_quality_tracks[track.parentRatingKey] = (order_key, track.media[0].audioCodec, track.media[0].bitrate)
+
+    if total is not None:
+        print_progress_bar(total, total, "Checking tracks", progress_started_at)
+        if INTERACTIVE_OUTPUT:
+            print()
+
+    return low_quality_tracks
+
+
+def get_scan_results_key(section: MusicSection, force_all: bool = False, force_lossless: bool = False) -> str:
+    """
+    Function: get_scan_results_key()
+
+    Returns the key under which the results of a low bitrate scan are cached. The key changes whenever the library
+    section is updated or the quality requirements differ, so outdated results are never reused.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
+    :returns: The key of the cached scan results
+    :rtype: str
+    """
+
+    updated_at = section.updatedAt.isoformat() if section.updatedAt else ""
+
+    return f"{section.uuid}:{updated_at}:{int(force_all)}:{int(force_lossless)}"
+
+
+def load_scan_results(
+    section: MusicSection, force_all: bool = False, force_lossless: bool = False
+) -> list[dict] | None:
+    """
+    Function: load_scan_results()
+
+    Loads the cached results of a previous low bitrate scan of a library section.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
+    :returns: A list of dicts describing all albums with low bitrate, or None if there are no cached results
+    :rtype: list[dict]|None
+    """
+
+    if section.updatedAt is None:
+        return None
+
+    return read_cache_file("scan.json").get(get_scan_results_key(section, force_all, force_lossless))
+
+
+def save_scan_results(
+    section: MusicSection,
+    low_bitrate_albums: list[dict],
+    force_all: bool = False,
+    force_lossless: bool = False,
+) -> None:
+    """
+    Function: save_scan_results()
+
+    Caches the results of a low bitrate scan of a library section, replacing previous results of the same section.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param low_bitrate_albums: A list of dicts describing all albums with low bitrate
+    :type low_bitrate_albums: list[dict]
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
+    """
+
+    if section.updatedAt is None:
+        return
+
+    # Drop outdated results of the same section
+    scan_results = {
+        key: value for key, value in read_cache_file("scan.json").items() if not key.startswith(f"{section.uuid}:")
+    }
+    scan_results[get_scan_results_key(section, force_all, force_lossless)] = low_bitrate_albums
+
+    write_cache_file("scan.json", scan_results)
+
+
+def get_last_scan(section: MusicSection) -> datetime.datetime | None:
+    """
+    Function: get_last_scan()
+
+    Returns when a library section has last been scanned for albums with low bitrate.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :returns: Datetime when the last scan started, or None if the section hasn't been scanned yet
+    :rtype: datetime.datetime|None
+    """
+
+    last_scan = read_cache_file("last_scan.json").get(section.uuid)
+
+    return datetime.datetime.fromisoformat(last_scan) if last_scan else None
+
+
+def save_last_scan(section: MusicSection, started_at: datetime.datetime) -> None:
+    """
+    Function: save_last_scan()
+
+    Saves when a library section has last been scanned for albums with low bitrate.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param started_at: Datetime when the scan started
+    :type started_at: datetime.datetime
+    """
+
+    last_scans = read_cache_file("last_scan.json")
+    last_scans[section.uuid] = started_at.isoformat()
+
+    write_cache_file("last_scan.json", last_scans)
+
+
+def low_bitrate_album_to_str(album: dict) -> str:
+    """
+    Function: low_bitrate_album_to_str()
+
+    Converts an album with low bitrate to a readable string representation.
+
+    :param album: Dict with the artist, title, year, audio codec and bitrate of the album
+    :type album: dict
+    :returns: String representation of the album
+    :rtype: str
+    """
+
+    return f"{album['artist']} - {album['album']} ({album['year']}) [{album['codec']}][{album['bitrate']}]"
+
+
+def scan_low_bitrate_albums(
+    section: MusicSection,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    force_all: bool = False,
+    force_lossless: bool = False,
+    added_since: datetime.datetime | None = None,
+) -> list[dict]:
+    """
+    Function: scan_low_bitrate_albums()
+
+    Scans a music library section for albums with at least one track which fails to meet the quality requirements
+    as defined in check_quality_requirements(). All tracks of the section are fetched in large, concurrently requested
+    batches and checked in a single pass instead of requesting and checking the tracks of every single album separately.
+
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param max_workers: Maximum number of concurrent requests
+    :type max_workers: int
+    :param force_all: Whether every track should fail the quality requirements
+    :type force_all: bool
+    :param force_lossless: Whether only lossless tracks should meet the quality requirements
+    :type force_lossless: bool
+    :param added_since: Only scan albums which have been added after this datetime
+    :type added_since: datetime.datetime|None
+    :returns: A list of dicts with the artist, title, year, audio codec and bitrate of all albums with low bitrate
+    :rtype: list[dict]
+    """
+
+    # Check all tracks at once instead of requesting the tracks of every single album. If possible, let the Plex server
+    # filter out all tracks which meet the quality requirements anyway, so only a fraction of the tracks is transferred.
+    # Filters which are rejected are left out one by one, as an unsupported filter shouldn't void the other one.
+    quality_filters = get_low_quality_track_filters(force_all, force_lossless)
+    added_since_filters = {"album.addedAt>>": added_since} if added_since is not None else None
+    candidate_filters = [
+        filters
+        for filters in (
+            (quality_filters | added_since_filters) if quality_filters and added_since_filters else None,
+            added_since_filters,
+            quality_filters,
+        )
+        if filters
+    ]
+    low_quality_track_filters = next(
+        (filters for filters in candidate_filters if search_filters_accepted(section, "track", filters)), None
+    )
+
+    if added_since is not None and "album.addedAt>>" not in (low_quality_track_filters or {}):
+        print(
+            "WARNING: The Plex server rejected the search filter for recently added albums, so all albums are scanned "
+            f"instead of only those added since {added_since}.",
+            file=sys.stderr,
+        )
+        added_since = None
+
+    if low_quality_track_filters:
+        low_quality_tracks = get_low_quality_tracks_by_album(
+            section, max_workers, force_all, force_lossless, low_quality_track_filters
+        )
+    else:
+        # Without filters all tracks are loaded, which takes a while, so the progress is printed
+        low_quality_tracks = get_low_quality_tracks_by_album(
+            section,
+            max_workers,
+            force_all,
+            force_lossless,
+            total=section.totalViewSize(libtype="track", includeCollections=False) or 0,
+        )
+
+    low_bitrate_albums = []
+
+    # Only list the albums which have been checked. The number of albums is only known in advance if all are listed.
+    album_filters = {"album.addedAt>>": added_since} if added_since is not None else None
+    total_albums = None if album_filters else section.totalViewSize(libtype="album", includeCollections=False) or 0
+    progress_started_at = datetime.datetime.now()
+    if total_albums is not None:
+        print_progress_bar(0, total_albums, "Checking albums", progress_started_at)
+
+    # Get all albums and look up if one of their tracks fails to meet the quality criteria
+    for index, album in enumerate(iter_section_items(section, "album", max_workers, album_filters), start=1):
+        # Albums are loaded in batches, so the progress only has to be updated once per batch
+        if total_albums is not None and index % LIBRARY_CONTAINER_SIZE == 0:
+            print_progress_bar(index, total_albums, "Checking albums", progress_started_at)
+
+        low_quality_track = low_quality_tracks.get(album.ratingKey)
+        if low_quality_track is None:
+            continue
+
+        _, audio_codec, bitrate = low_quality_track
+
+        low_bitrate_albums.append(
+            {
+                "artist": album.parentTitle,
+                "album": album.title,
+                "year": album.year,
+                "codec": audio_codec,
+                "bitrate": bitrate,
+            },
+        )
+
+    if total_albums is not None:
+        print_progress_bar(total_albums, total_albums, "Checking albums", progress_started_at)
+        if INTERACTIVE_OUTPUT:
+            print()
+            print()
+
+    return low_bitrate_albums
+
+
+def find_low_bitrate_albums(
+    config: PlexConfig,
+    section: MusicSection,
+    added_since: datetime.datetime | None = None,
+) -> list[str]:
+    """
+    Function: find_low_bitrate_albums()
+
+    Finds all albums in a music library section with at least one track which fails to meet the quality requirements
+    as defined in check_quality_requirements(). If enabled, the results of a previous scan are reused as long as the
+    library section hasn't been updated since.
+
+    :param config: PlexConfig object
+    :type config: PlexConfig
+    :param section: MusicSection object
+    :type section: MusicSection
+    :param added_since: Only find albums which have been added after this datetime
+    :type added_since: datetime.datetime|None
+    :returns: A list of string representations of all albums with low bitrate
+    :rtype: list[str]
+    """
+
+    clear()
+
+    if INTERACTIVE_OUTPUT:
+        print(
+            "Album search in progress. This may take a while depending on the size of your music library. "
+            "Please be patient.",
+        )
+        print()
+
+    force_all = bool(config.get("upgrade.force_all"))
+    force_lossless = bool(config.get("upgrade.force_lossless"))
+
+    # Reuse the results of a previous scan of the whole section if the library section hasn't been updated since
+    cache_scan_results = bool(config.get("cache.scan_results")) and added_since is None
+    low_bitrate_albums = load_scan_results(section, force_all, force_lossless) if cache_scan_results else None
+
+    if low_bitrate_albums is None:
+        scan_started_at = datetime.datetime.now()
+        low_bitrate_albums = scan_low_bitrate_albums(
+            section, get_max_workers(config), force_all, force_lossless, added_since
+        )
+        save_last_scan(section, scan_started_at)
+        if cache_scan_results:
+            save_scan_results(section, low_bitrate_albums, force_all, force_lossless)
+    elif INTERACTIVE_OUTPUT:
+        print("The library section hasn't been updated since the last scan, so its results are shown.")
+        print()
+
+    # Print all albums at once instead of writing every single line to the shell separately. If the output is
+    # redirected, only the albums are written as JSON lines.
+    if low_bitrate_albums and INTERACTIVE_OUTPUT:
+        print("\n".join(f"❌ {low_bitrate_album_to_str(album)} must be upgraded." for album in low_bitrate_albums))
+    elif low_bitrate_albums:
+        print("\n".join(json.dumps(album, ensure_ascii=False) for album in low_bitrate_albums))
+
+    return [low_bitrate_album_to_str(album) for album in low_bitrate_albums]
+
+
 def export_playlist_as_m3u(config: PlexConfig, playlist: Playlist) -> Path:
     """
     Function: export_playlist_as_m3u()
@@ -1215,13 +2271,18 @@ def export_playlist_as_m3u(config: PlexConfig, playlist: Playlist) -> Path:
 
 
 if __name__ == "__main__":
+    # Load answers to prompts which have been given on the command line
+    arguments = get_arguments()
+    PROMPT_ANSWERS.update(get_prompt_answers(arguments))
+    USE_DEFAULT_ANSWERS = arguments.use_defaults
+
     clear()
 
     # Load configuration
     config = get_config()
 
     # Connect to the Plex server
-    server = get_server(config)
+    server = configure_session(config, get_server(config))
 
     while True:
         # Decide what you want to organize
@@ -1234,6 +2295,7 @@ if __name__ == "__main__":
                 "Export playlist as M3U (audio & video)",
             ],
             automatic_single_coice_return=False,
+            key="action",
         )
 
         # Sort playlists (audio & video)
@@ -1245,6 +2307,7 @@ if __name__ == "__main__":
                 items=playlists,
                 attr="title",
                 automatic_single_coice_return=False,
+                key="playlist",
             )
 
             # Select the sorting method
@@ -1260,6 +2323,7 @@ if __name__ == "__main__":
             duplicate = confirm_question(
                 "Do you want to create a duplicated playlist instead of modifying the selected one?",
                 default=False,
+                key="duplicate",
             )
 
             # Sort playlist
@@ -1272,6 +2336,7 @@ if __name__ == "__main__":
                 backup_secondary_sort_key=backup_secondary_sort_key,
                 sort_reverse=sort_reverse,
                 duplicate=duplicate,
+                recreate=bool(config.get("sort.recreate_playlist")),
             )
 
             clear()
@@ -1285,6 +2350,7 @@ if __name__ == "__main__":
                 items=playlists,
                 attr="title",
                 automatic_single_coice_return=False,
+                key="playlist",
             )
 
             clear()
@@ -1293,6 +2359,7 @@ if __name__ == "__main__":
             dry = confirm_question(
                 "Do you want to perform a dry run instead of actually modifying anything?",
                 default=False,
+                key="dry_run",
             )
 
             # Decide on whether the simple replacement mode should be used
@@ -1303,6 +2370,7 @@ if __name__ == "__main__":
                     "Do you want to enable the simple replacement mode "
                     "(The best version available will automatically be selected)?",
                     default=False,
+                    key="simple_mode",
                 )
             )
 
@@ -1313,6 +2381,7 @@ if __name__ == "__main__":
                 else confirm_question(
                     "Do you want to create a duplicated playlist instead of modifying the selected one?",
                     default=False,
+                    key="duplicate",
                 )
             )
 
@@ -1333,52 +2402,37 @@ if __name__ == "__main__":
         # Find all music albums with low bitrate (audio only)
         elif action == "Find all music albums with low bitrate (audio only)":
             # Select a library section to connect to
-            sections = get_sections(server, "artist")
+            sections = get_sections(server, "artist", refresh=True)
             section = question(
                 message="Select a section to connect to",
                 items=sections,
                 attr="title",
                 automatic_single_coice_return=True,
+                key="section",
             )
 
             # Decide on whether to save the list of albums to a local text file
             save_to_file = confirm_question(
                 "Do you want to save the list of albums to a local text file?",
                 default=False,
+                key="save_to_file",
             )
 
-            clear()
-
-            print(
-                "Album search in progress. This may take a while depending on the size of your music library. "
-                "Please be patient.",
-            )
-            print()
-
-            low_bitrate_albums = []
-
-            # Get all albums
-            for album in section.albums():
-                # Get all tracks of the album and check if they all meet the quality criteria
-                for track in album.tracks():
-                    if not check_quality_requirements(track):
-                        low_bitrate_album = (
-                            f"{album.parentTitle} - {album.title} ({album.year}) "
-                            f"[{track.media[0].audioCodec}][{track.media[0].bitrate}]"
-                        )
-                        low_bitrate_albums.append(low_bitrate_album)
-                        print(
-                            f"❌ {low_bitrate_album} must be upgraded.",
-                        )
-                        break
+            # Find albums with low bitrate, optionally only those added since the given date or the last scan
+            added_since = get_last_scan(section) if arguments.since == "last" else arguments.since
+            low_bitrate_albums = find_low_bitrate_albums(config=config, section=section, added_since=added_since)
 
             if len(low_bitrate_albums) and save_to_file:
                 file_name = f"low_bitrate_albums_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
                 with open(file_name, "w", encoding="utf-8") as file:
                     file.write("\n".join(sorted(low_bitrate_albums)))
-                print(f"✅ Saved {len(low_bitrate_albums)} entries to '{file_name}'.")
+                # Keep redirected output free of anything but the albums
+                print(
+                    f"✅ Saved {len(low_bitrate_albums)} entries to '{file_name}'.",
+                    file=sys.stdout if INTERACTIVE_OUTPUT else sys.stderr,
+                )
                 clear()
-            else:
+            elif INTERACTIVE_OUTPUT:
                 print()
                 print()
 
@@ -1390,6 +2444,7 @@ if __name__ == "__main__":
                 items=playlists,
                 attr="title",
                 automatic_single_coice_return=False,
+                key="playlist",
             )
 
             export_playlist_as_m3u(
@@ -1397,5 +2452,5 @@ if __name__ == "__main__":
                 playlist=playlist,
             )
 
-        if not confirm_question("Do you want to organize another playlist?"):
+        if not confirm_question("Do you want to organize another playlist?", key="organize_another"):
             sys.exit()